@@ -2,7 +2,8 @@
 
 __version__ = "0.4.0"
 
-from .build import BuildResult, build_site
+from typing import TYPE_CHECKING
+
 from .checker import (
     DURABLE_FORMAT_CATEGORIES,
     ComplianceResult,
@@ -13,6 +14,9 @@ from .checker import (
 )
 from .discovery import discover_sources, matches_query, search_sources
 
+if TYPE_CHECKING:
+    from .build import BuildResult, build_site
+
 __all__ = [
     "BuildResult",
     "ComplianceResult",
@@ -27,3 +31,13 @@ __all__ = [
     "parse_readme",
     "search_sources",
 ]
+
+
+def __getattr__(name: str):
+    # The site builder pulls in jinja2 and markdown, so it is only imported
+    # once build_site or BuildResult is actually used.
+    if name in ("BuildResult", "build_site"):
+        from . import build
+
+        return getattr(build, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,25 +1,45 @@
 """longecho site builder -- generates a single-file application from a longecho archive."""
 
+import functools
+import os
 import re
+import stat
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+import markdown
+import yaml
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    select_autoescape,
+)
 
 from . import __version__
 from .checker import (
     DEFAULT_FORMAT_SCAN_DEPTH,
     DURABLE_EXTENSIONS,
     EXCLUDE_PATTERNS,
+    ComplianceResult,
     EchoSource,
+    _find_readme_in,
     check_compliance,
-    find_readme,
     parse_readme,
 )
 from .discovery import should_skip_directory
 
+# Upper bound on worker threads used to convert sibling sources concurrently.
+MAX_BUILD_WORKERS: int = 8
+
 
 @dataclass
 class BuildResult:
@@ -31,50 +51,130 @@ class BuildResult:
     error: Optional[str] = None
 
 
+_jinja_env: Optional[Environment] = None
+
+
 def get_jinja_env() -> Environment:
-    """Create Jinja2 environment with templates."""
-    return Environment(
-        loader=PackageLoader("longecho", "templates"),
-        autoescape=select_autoescape(["html", "xml"]),
-    )
+    """Return the shared Jinja2 environment, creating it on first use.
+
+    Templates ship inside the package and never change at runtime, so the
+    environment is built once with ``auto_reload`` off and its compiled
+    templates are reused across builds. Compiled bytecode is also cached
+    on disk (Jinja's per-user temp directory) so later CLI runs skip
+    parsing the template, when that directory is usable.
+    """
+    global _jinja_env
+    if _jinja_env is None:
+        _jinja_env = Environment(
+            loader=PackageLoader("longecho", "templates"),
+            autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+            bytecode_cache=_make_bytecode_cache(),
+        )
+    return _jinja_env
+
+
+def _make_bytecode_cache() -> Optional[BytecodeCache]:
+    """Return Jinja's on-disk bytecode cache, or None if it can't be used.
+
+    The default cache directory is refused (RuntimeError) when e.g. another
+    user already owns it on a shared /tmp. The cache only saves parse time,
+    so the build goes on without it.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+@functools.cache
+def _get_template(name: str) -> Template:
+    """Return a compiled template from the shared environment, memoized by name."""
+    return get_jinja_env().get_template(name)
+
+
+# Sanitizer patterns, compiled once; _sanitize_html runs on every README.
+# Dangerous tags with content
+_DANGEROUS_BLOCK_RE = re.compile(
+    r"<(script|style|iframe|object|embed)\b[^>]*>.*?</\1>",
+    re.DOTALL | re.IGNORECASE,
+)
+# Self-closing and opening-only dangerous tags (base, meta, link are void
+# elements). The optional slash means one pattern covers both forms.
+_DANGEROUS_VOID_RE = re.compile(
+    r"<(script|style|iframe|object|embed|base|meta|link)\b[^>]*/?>",
+    re.IGNORECASE,
+)
+_FORM_TAG_RE = re.compile(r"</?form\b[^>]*>", re.IGNORECASE)
+# on* event handlers, quoted and unquoted (stop at > or whitespace)
+_EVENT_QUOTED_RE = re.compile(r"\s+on\w+\s*=\s*[\"'][^\"']*[\"']", re.IGNORECASE)
+_EVENT_UNQUOTED_RE = re.compile(r"\s+on\w+\s*=\s*[^\s>]+", re.IGNORECASE)
+# javascript: URIs in href/src/action attributes
+_JS_URI_RE = re.compile(
+    r'(href|src|action)\s*=\s*["\']?\s*javascript:[^"\'>\s]*["\']?',
+    re.IGNORECASE,
+)
 
 
 def _sanitize_html(html: str) -> str:
     """Strip dangerous HTML elements from rendered markdown."""
-    # Remove dangerous tags with content
-    html = re.sub(
-        r"<(script|style|iframe|object|embed)\b[^>]*>.*?</\1>",
-        "", html, flags=re.DOTALL | re.IGNORECASE,
-    )
-    # Remove self-closing dangerous tags
-    html = re.sub(
-        r"<(script|style|iframe|object|embed|base|meta|link)\b[^>]*/?>",
-        "", html, flags=re.IGNORECASE,
-    )
-    # Remove opening-only dangerous tags (base, meta, link are void elements)
-    html = re.sub(
-        r"<(base|meta|link)\b[^>]*>",
-        "", html, flags=re.IGNORECASE,
-    )
-    # Remove form tags
-    html = re.sub(r"</?form\b[^>]*>", "", html, flags=re.IGNORECASE)
-    # Remove on* event handlers (quoted)
-    html = re.sub(r"\s+on\w+\s*=\s*[\"'][^\"']*[\"']", "", html, flags=re.IGNORECASE)
-    # Remove on* event handlers (unquoted, stop at > or whitespace)
-    html = re.sub(r"\s+on\w+\s*=\s*[^\s>]+", "", html, flags=re.IGNORECASE)
-    # Remove javascript: URIs in href/src/action attributes
-    html = re.sub(
-        r'(href|src|action)\s*=\s*["\']?\s*javascript:[^"\'>\s]*["\']?',
-        "", html, flags=re.IGNORECASE,
-    )
+    html = _DANGEROUS_BLOCK_RE.sub("", html)
+    # Repeat until nothing matches: removing one tag can splice the text
+    # around it into another (e.g. "<me<link>ta>"). Clean input takes a
+    # single pass.
+    html, removed = _DANGEROUS_VOID_RE.subn("", html)
+    while removed:
+        html, removed = _DANGEROUS_VOID_RE.subn("", html)
+    html = _FORM_TAG_RE.sub("", html)
+    html = _EVENT_QUOTED_RE.sub("", html)
+    html = _EVENT_UNQUOTED_RE.sub("", html)
+    html = _JS_URI_RE.sub("", html)
     return html
 
 
+# Markdown instances aren't thread-safe, so each build worker keeps its own.
+_markdown_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return this thread's configured Markdown converter, creating it on first use."""
+    md: Optional[markdown.Markdown] = getattr(_markdown_local, "md", None)
+    if md is None:
+        md = markdown.Markdown(extensions=["fenced_code", "tables"])
+        _markdown_local.md = md
+    return md
+
+
+# Anything that could make markdown emit more than one plain paragraph:
+# inline/block syntax, HTML-significant characters, blank lines, ordered
+# list markers, and leading/trailing or indentation whitespace.
+_MARKDOWN_SYNTAX_RE = re.compile(
+    r"[\\`*_\[\]!<>&#|~=+\-:\t\r\f\v]|\n\s*\n|\n |\s\n|\d\.|^\s|\s$"
+)
+
+
 def markdown_to_html(content: str) -> str:
-    """Convert markdown to sanitized HTML."""
-    import markdown
+    """Convert markdown to sanitized HTML.
+
+    Text with no markdown syntax at all renders as a single paragraph, so
+    it is wrapped directly instead of going through the converter.
+    """
+    text = content.strip("\n")
+    if not text:
+        return ""
+    if not _MARKDOWN_SYNTAX_RE.search(text):
+        return f"<p>{text}</p>"
+    return _render_markdown(content)
 
-    html: str = markdown.markdown(content, extensions=["fenced_code", "tables"])
+
+@functools.lru_cache(maxsize=512)
+def _render_markdown(content: str) -> str:
+    """Full markdown conversion plus sanitizing, memoized on the source text.
+
+    Repeated builds of the same archive (or a README shared by several
+    sources) skip the regex-heavy convert/sanitize pipeline.
+    """
+    html: str = _get_markdown().reset().convert(content)
     return _sanitize_html(html)
 
 
@@ -87,39 +187,55 @@ def _get_data_files(source: EchoSource, output_path: Path) -> list[dict]:
     not data.
     """
     files: list[dict] = []
-    output_parent = output_path.parent
-
-    def scan(path: Path, depth: int) -> None:
-        if depth > DEFAULT_FORMAT_SCAN_DEPTH:
-            return
+    # Entries are built by joining onto these directories, so relative
+    # names fall out of plain string slicing (same result as relative_to).
+    root_prefix = os.path.join(os.fspath(source.path), "")
+    output_prefix = os.path.join(os.fspath(output_path.parent), "")
+
+    # Explicit work stack rather than a recursive closure; the result is
+    # sorted at the end, so traversal order doesn't matter.
+    stack: list[tuple[str, int]] = [(os.fspath(source.path), 0)]
+    while stack:
+        dir_path, depth = stack.pop()
         try:
-            for item in sorted(path.iterdir()):
-                if item.name.startswith("."):
-                    continue
-                if item.is_file():
-                    if item.name in EXCLUDE_PATTERNS:
-                        continue
-                    if item.suffix.lower() not in DURABLE_EXTENSIONS:
-                        continue
-                    rel_name = str(item.relative_to(source.path))
-                    try:
-                        rel_path = str(item.relative_to(output_parent))
-                    except ValueError:
-                        # Output is outside the archive — use absolute file:// URI
-                        rel_path = item.as_uri()
-                    files.append({"name": rel_name, "path": rel_path})
-                elif item.is_dir():
-                    if item.name == "site" or should_skip_directory(item.name):
-                        continue
-                    # Don't descend into nested sources — they own their own data
-                    if find_readme(item) is not None:
-                        continue
-                    scan(item, depth + 1)
+            with os.scandir(dir_path) as it:
+                entries = list(it)
         except PermissionError:
-            pass
+            continue
 
-    scan(source.path, 0)
-    return sorted(files, key=lambda x: x["name"])
+        # Don't descend into nested sources — they own their own data.
+        # Checking the listing we already have saves a find_readme() stat
+        # per subdirectory.
+        if depth > 0 and _find_readme_in(Path(dir_path), entries) is not None:
+            continue
+
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            if entry.is_file():
+                if name in EXCLUDE_PATTERNS:
+                    continue
+                # Same suffix test as checker._scan_formats.
+                dot = name.rfind(".")
+                if dot <= 0 or name[dot:].lower() not in DURABLE_EXTENSIONS:
+                    continue
+                file_path = entry.path
+                rel_name = file_path[len(root_prefix):]
+                if file_path.startswith(output_prefix):
+                    rel_path = file_path[len(output_prefix):]
+                else:
+                    # Output is outside the archive — use absolute file:// URI
+                    rel_path = Path(file_path).as_uri()
+                files.append({"name": rel_name, "path": rel_path})
+            elif entry.is_dir():
+                if name == "site" or should_skip_directory(name):
+                    continue
+                if depth < DEFAULT_FORMAT_SCAN_DEPTH:
+                    stack.append((entry.path, depth + 1))
+
+    files.sort(key=itemgetter("name"))
+    return files
 
 
 def _is_foreign_site(output_path: Path) -> tuple[bool, str]:
@@ -146,38 +262,95 @@ def _is_foreign_site(output_path: Path) -> tuple[bool, str]:
     return True, gen_str
 
 
-def discover_sub_sources(source: EchoSource) -> list[EchoSource]:
-    """Discover sub-sources using contents field or auto-discovery."""
+def _cached_compliance(
+    path: Path, cache: Optional[dict[Path, ComplianceResult]] = None
+) -> ComplianceResult:
+    """check_compliance, memoized in ``cache`` when one is given.
+
+    build_site creates a fresh cache per build and passes it down, so
+    standalone callers (and later or concurrent builds) always see the
+    filesystem as it is now.
+    """
+    if cache is None:
+        return check_compliance(path)
+    result = cache.get(path)
+    if result is None:
+        result = check_compliance(path)
+        cache[path] = result
+    return result
+
+
+def _check_all(
+    paths: list[Path],
+    cache: Optional[dict[Path, ComplianceResult]] = None,
+    check_pool: Optional[Executor] = None,
+) -> list[ComplianceResult]:
+    """Run compliance checks on several directories concurrently, in order.
+
+    Each check is independent file I/O (README read, format scan), so a
+    pool overlaps the waits. build_site passes one shared ``check_pool``
+    for the whole build; without it a short-lived pool is used. The tasks
+    never submit further work, so this is safe to call from inside another
+    pool's worker.
+    """
+    if len(paths) < 2:
+        return [_cached_compliance(p, cache) for p in paths]
+    if check_pool is not None:
+        return list(check_pool.map(lambda p: _cached_compliance(p, cache), paths))
+    with ThreadPoolExecutor(max_workers=min(MAX_BUILD_WORKERS, len(paths))) as ex:
+        return list(ex.map(lambda p: _cached_compliance(p, cache), paths))
+
+
+def discover_sub_sources(
+    source: EchoSource,
+    cache: Optional[dict[Path, ComplianceResult]] = None,
+    check_pool: Optional[Executor] = None,
+) -> list[EchoSource]:
+    """Discover sub-sources using contents field or auto-discovery.
+
+    Compliance results are memoized in ``cache`` when one is given, and
+    candidates are checked on ``check_pool`` when one is given.
+    """
     path = source.path
-    sources: list[EchoSource] = []
+    candidates: list[Path] = []
 
     if source.contents:
-        # Curated: only listed paths, in order
+        # Curated: only listed paths, in order. source.path is already
+        # resolved, so a lexical normpath cheaply rejects ".." escapes and
+        # the root itself; realpath() then catches symlinks that lead out.
+        root = os.fspath(path)
+        root_prefix = os.path.join(root, "")
         for entry in source.contents:
             entry_path = entry.get("path", "")
-            sub_path = (path / entry_path).resolve()
-            # Prevent path traversal
-            if not sub_path.is_relative_to(path):
+            sub_path = os.path.normpath(os.path.join(root, str(entry_path)))
+            # Prevent path traversal (and the root listing itself, which
+            # would make the source its own child)
+            if not sub_path.startswith(root_prefix):
                 continue
-            if not sub_path.is_dir():
+            if not os.path.realpath(sub_path).startswith(root_prefix):
                 continue
-
-            result = check_compliance(sub_path)
-            if result.compliant and result.source:
-                sources.append(result.source)
-    else:
-        # Auto-discover: all compliant subdirectories, alphabetical
-        for item in sorted(path.iterdir()):
-            if not item.is_dir():
+            if not os.path.isdir(sub_path):
                 continue
-            if item.name == "site" or should_skip_directory(item.name):
-                continue
-
-            result = check_compliance(item)
-            if result.compliant and result.source:
-                sources.append(result.source)
-
-    return sources
+            candidates.append(Path(sub_path))
+    else:
+        # Auto-discover: all compliant subdirectories, alphabetical.
+        # DirEntry caches its type from the directory listing, so filtering
+        # here avoids a stat() per entry.
+        with os.scandir(path) as it:
+            entries = [
+                e for e in it
+                if e.name != "site"
+                and not should_skip_directory(e.name)
+                and e.is_dir()
+            ]
+        entries.sort(key=attrgetter("name"))
+        candidates = [Path(e.path) for e in entries]
+
+    return [
+        result.source
+        for result in _check_all(candidates, cache, check_pool)
+        if result.compliant and result.source
+    ]
 
 
 def make_json_safe(obj: object) -> object:
@@ -191,20 +364,45 @@ def make_json_safe(obj: object) -> object:
     return obj
 
 
-def _source_to_json(source: EchoSource, output_path: Path) -> dict:
-    """Convert an EchoSource to a JSON-serializable dict for the SFA, recursively."""
+def _source_to_json(
+    source: EchoSource,
+    output_path: Path,
+    executor: Optional[Executor] = None,
+    cache: Optional[dict[Path, ComplianceResult]] = None,
+    check_pool: Optional[Executor] = None,
+) -> dict:
+    """Convert an EchoSource to a JSON-serializable dict for the SFA, recursively.
+
+    When ``executor`` is given, this source's children are converted
+    concurrently on it. Deeper levels run serially inside each worker so a
+    bounded pool can never deadlock waiting on its own tasks.
+    """
     readme_html = ""
-    try:
-        content = source.readme_path.read_text(encoding="utf-8")
-        readme_html = markdown_to_html(content)
-    except (OSError, UnicodeDecodeError):
-        pass
+    if source.readme_text is not None:
+        readme_html = markdown_to_html(source.readme_text)
+    else:
+        try:
+            # Raw bytes skip the text-mode wrapper; markdown normalizes line
+            # endings itself, so newline translation isn't needed here.
+            content = source.readme_path.read_bytes().decode("utf-8")
+            readme_html = markdown_to_html(content)
+        except (OSError, UnicodeDecodeError):
+            pass
 
     frontmatter: dict = make_json_safe(source.frontmatter or {})  # type: ignore[assignment]
 
     # Recursively discover and convert children
-    child_sources = discover_sub_sources(source)
-    children = [_source_to_json(c, output_path) for c in child_sources]
+    child_sources = discover_sub_sources(source, cache, check_pool)
+    if executor is not None and len(child_sources) > 1:
+        children = list(executor.map(
+            lambda c: _source_to_json(c, output_path, None, cache, check_pool),
+            child_sources,
+        ))
+    else:
+        children = [
+            _source_to_json(c, output_path, None, cache, check_pool)
+            for c in child_sources
+        ]
 
     # Compute relative path to source's site/index.html if it exists.
     # Skip self-references: the root source's site IS the output we're
@@ -238,12 +436,11 @@ def _generate_site_readme(
     name: str,
     sources: list[EchoSource],
     output_path: Path,
+    built_at: time.struct_time,
 ) -> None:
     """Generate a longecho-compliant README.md for the site/ directory."""
-    import yaml
-
     source_names = ", ".join(s.name for s in sources)
-    now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    now = time.strftime("%Y-%m-%dT%H:%M:%S", built_at)
 
     frontmatter = {
         "name": f"{name} Site",
@@ -258,7 +455,7 @@ def _generate_site_readme(
 
     content = f"---\n{fm_yaml}---\n\nGenerated by longecho from {len(sources)} source(s): {source_names}.\nOpen index.html in any browser to explore.\n"
     readme_path = output_path / "README.md"
-    readme_path.write_text(content, encoding="utf-8")
+    readme_path.write_bytes(content.encode("utf-8"))
 
 
 def _count_sources(data: list[dict]) -> int:
@@ -281,12 +478,30 @@ def build_site(
     fails unless ``force=True``. This protects tool-generated viewers
     (e.g. ctk, chartfold) from being silently clobbered.
     """
+    # Each build gets its own compliance memo, so concurrent builds never
+    # share or reset each other's state, and one bounded pool for the leaf
+    # compliance checks instead of a fresh pool per directory.
+    with ThreadPoolExecutor(max_workers=MAX_BUILD_WORKERS) as check_pool:
+        return _build_site(path, output, force, {}, check_pool)
+
+
+def _build_site(
+    path: Path,
+    output: Optional[Path],
+    force: bool,
+    cache: dict[Path, ComplianceResult],
+    check_pool: Executor,
+) -> BuildResult:
+    """Body of build_site, with the per-build compliance cache and check pool."""
     path = Path(path).resolve()
 
-    if not path.exists():
+    # One stat answers both existence and type.
+    try:
+        st = path.stat()
+    except OSError:
         return BuildResult(success=False, error=f"Path does not exist: {path}")
 
-    if not path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         return BuildResult(success=False, error=f"Path is not a directory: {path}")
 
     result = check_compliance(path)
@@ -298,8 +513,8 @@ def build_site(
 
     root_source = result.source
     # Pre-compute top-level children for the site README (cheap, sourced
-    # from check_compliance cache; _source_to_json will walk again).
-    top_level_children = discover_sub_sources(root_source)
+    # from the per-build compliance cache; _source_to_json will walk again).
+    top_level_children = discover_sub_sources(root_source, cache, check_pool)
 
     output_path = Path(output).resolve() if output else path / "site"
 
@@ -322,21 +537,38 @@ def build_site(
     # files, metadata, and recursively nested children). This unifies the
     # home view with the detail view: every view in the SFA is the detail
     # view of some source, and the home view is the root's detail view.
-    root_data = _source_to_json(root_source, output_path)
-
-    env = get_jinja_env()
-    template = env.get_template("sfa.html")
-    html = template.render(
-        name=root_source.name,
-        description=root_source.description,
-        root_data=root_data,
-        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
-    )
+    # Each top-level subtree is independent and I/O bound (README reads,
+    # directory walks), so they're converted in parallel.
+    with ThreadPoolExecutor(max_workers=MAX_BUILD_WORKERS) as executor:
+        root_data = _source_to_json(
+            root_source, output_path, executor, cache, check_pool
+        )
 
+    # One clock reading per build so the page footer and the site README
+    # agree on when the build happened.
+    built_at = time.localtime()
+    template = _get_template("sfa.html")
+    # Stream straight to disk rather than materializing the whole page
+    # (which inlines every README) as one string first. The page goes to a
+    # temporary file that replaces index.html only once rendering finished,
+    # so a failed build leaves the previous site intact.
     index_path = output_path / "index.html"
-    index_path.write_text(html, encoding="utf-8")
-
-    _generate_site_readme(root_source.name, top_level_children, output_path)
+    tmp_path = output_path / f".index.html.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        template.stream(
+            name=root_source.name,
+            description=root_source.description,
+            root_data=root_data,
+            generated_at=time.strftime("%Y-%m-%d %H:%M", built_at),
+        ).dump(str(tmp_path), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _generate_site_readme(
+        root_source.name, top_level_children, output_path, built_at
+    )
 
     return BuildResult(
         success=True,
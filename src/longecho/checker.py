@@ -1,11 +1,15 @@
 """longecho compliance checker."""
 
-from dataclasses import dataclass, field
+import copy
+import functools
+import os
+import re
+import sys
+from collections import deque
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 # Single source of truth for durable format categories.
 # All display, spec, and compliance logic derives from this structure.
 DURABLE_FORMAT_CATEGORIES: dict[str, list[str]] = {
@@ -20,24 +24,55 @@ DURABLE_FORMAT_CATEGORIES: dict[str, list[str]] = {
     "Tabular / data": [".csv", ".tsv", ".xml", ".yaml", ".yml"],
 }
 
-# Derived flat set for O(1) membership testing
-DURABLE_EXTENSIONS: set[str] = {
+# Derived flat set for O(1) membership testing. Frozen: these are consulted
+# once per file during scans and never change at runtime.
+DURABLE_EXTENSIONS: frozenset[str] = frozenset(
     ext for exts in DURABLE_FORMAT_CATEGORIES.values() for ext in exts
-}
+)
 
-EXCLUDE_PATTERNS: set[str] = {
+EXCLUDE_PATTERNS: frozenset[str] = frozenset({
     "README.md", "README.txt",
     "CLAUDE.md", "CHANGELOG.md",
     ".gitignore", ".gitattributes",
     "pyproject.toml", "setup.py", "setup.cfg",
     "requirements.txt",
-}
+})
+
+# README filenames recognized at a source root, in lookup priority order.
+README_NAMES: tuple[str, ...] = ("README.md", "README.txt", "readme.md", "readme.txt")
+_README_NAMES_LOWER: frozenset[str] = frozenset(n.lower() for n in README_NAMES)
+
+# Slotted dataclasses (no per-instance __dict__) where supported; discovery
+# over large trees creates one EchoSource/ComplianceResult per directory.
+_SLOTS: dict = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 DEFAULT_FORMAT_SCAN_DEPTH: int = 2
+# Frontmatter: an opening line starting with ---, then everything up to the
+# first line that is --- on its own (surrounding whitespace allowed). Group 1
+# holds the YAML lines, each newline-terminated.
+_FRONTMATTER_RE = re.compile(
+    r"---[^\n]*\n((?:[^\n]*\n)*?)[^\S\n]*---[^\S\n]*(?:\n|\Z)"
+)
+# A frontmatter line YAML would read as a plain string value: a simple key,
+# then text starting with a letter and without YAML-significant characters
+# (no ':', '#', quotes at the start, or trailing whitespace).
+_FLAT_FRONTMATTER_LINE_RE = re.compile(
+    r"([A-Za-z_][A-Za-z0-9_-]*):[ ]+"
+    r"([A-Za-z](?:[A-Za-z0-9 _.,()/'-]*[A-Za-z0-9_.,()/'-])?)"
+)
+# Plain words YAML 1.1 resolves to booleans or null rather than strings.
+_YAML_SPECIAL_WORDS: frozenset[str] = frozenset({
+    "yes", "Yes", "YES", "no", "No", "NO",
+    "true", "True", "TRUE", "false", "False", "FALSE",
+    "on", "On", "ON", "off", "Off", "OFF",
+    "null", "Null", "NULL",
+})
+# Matches one line at a time; finditer yields the same lines as split("\n").
+_LINE_RE = re.compile(r"^.*$", re.MULTILINE)
 MAX_README_SUMMARY_LENGTH: int = 500
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Readme:
     """A README parsed into its structured parts."""
 
@@ -46,47 +81,112 @@ class Readme:
     summary: Optional[str]
 
 
+def _parse_flat_frontmatter(yaml_content: str) -> Optional[dict]:
+    """Parse frontmatter made only of plain ``key: Some text`` lines, else None.
+
+    Most READMEs carry a couple of simple string fields; for those, YAML
+    would produce exactly the raw text, so the parser is skipped. Anything
+    else (lists, quoting, numbers, dates, booleans, comments) returns None
+    and goes through YAML as usual.
+    """
+    parsed: dict = {}
+    for line in yaml_content.split("\n"):
+        if not line:
+            continue
+        m = _FLAT_FRONTMATTER_LINE_RE.fullmatch(line)
+        if m is None:
+            return None
+        key, value = m.groups()
+        if key in _YAML_SPECIAL_WORDS or value in _YAML_SPECIAL_WORDS:
+            return None
+        parsed[key] = value
+    return parsed or None
+
+
 def _split_frontmatter(content: str) -> tuple[Optional[dict], str]:
     """Split YAML frontmatter from markdown content.
 
     Returns (frontmatter dict or None, remaining body).
     """
-    if not content.startswith("---"):
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
+        # Not frontmatter, or no closing delimiter found
         return None, content
 
-    lines = content.split("\n")
-    # Find closing ---
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            yaml_content = "\n".join(lines[1:i])
-            body = "\n".join(lines[i + 1 :])
-            try:
-                parsed = yaml.safe_load(yaml_content)
-                if isinstance(parsed, dict):
-                    return parsed, body
-                return None, body
-            except yaml.YAMLError:
-                return None, body
+    yaml_content = match.group(1)[:-1]  # drop the newline before the closer
+    body = content[match.end():]
 
-    # No closing delimiter found
-    return None, content
+    flat = _parse_flat_frontmatter(yaml_content)
+    if flat is not None:
+        return flat, body
+    parsed = _load_yaml(yaml_content)
+    if isinstance(parsed, dict):
+        return parsed, body
+    return None, body
 
 
-def parse_readme(readme_path: Path) -> Optional[Readme]:
-    """Parse a README into frontmatter, title, and summary. Returns None if unreadable."""
+def _load_yaml(text: str) -> object:
+    """Parse YAML, returning None if it is malformed.
+
+    PyYAML is imported on first use: READMEs without frontmatter, or with
+    only flat ``key: value`` frontmatter, never need it. libyaml's C loader
+    is used when PyYAML was built with it.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        content = readme_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError:
         return None
 
+
+def _load_readme(readme_path: Path) -> tuple[Optional[str], Optional[Readme]]:
+    """Read and parse a README, returning (text, parsed) or (None, None) if unreadable.
+
+    Parses are memoized on the file's identity, mtime and size, so the same
+    unchanged README is only read and YAML-parsed once per process. Each
+    caller gets its own Readme (and frontmatter copy), so mutating a result
+    (or the EchoSource built from it) can't corrupt the cache.
+    """
+    try:
+        st = os.stat(readme_path)
+        text, readme = _load_readme_cached(
+            os.fspath(readme_path), st.st_ino, st.st_mtime_ns, st.st_size
+        )
+    except (OSError, UnicodeDecodeError):
+        return None, None
+    return text, replace(readme, frontmatter=copy.deepcopy(readme.frontmatter))
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_readme_cached(
+    path: str, ino: int, mtime_ns: int, size: int
+) -> tuple[str, Readme]:
+    """Cached body of _load_readme. Read errors raise, so they are never cached."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    return content, _parse_readme_text(content)
+
+
+def parse_readme(readme_path: Path) -> Optional[Readme]:
+    """Parse a README into frontmatter, title, and summary. Returns None if unreadable."""
+    return _load_readme(readme_path)[1]
+
+
+def _parse_readme_text(content: str) -> Readme:
+    """Parse already-read README text into frontmatter, title, and summary."""
     frontmatter, body = _split_frontmatter(content)
 
     title = None
     summary_lines: list[str] = []
+    summary_length = 0  # length of " ".join(summary_lines)
     in_paragraph = False
 
-    for line in body.split("\n"):
-        stripped = line.strip()
+    # Lines are pulled lazily: only the title and first paragraph matter, so
+    # there's no need to split a long README body up front.
+    for match in _LINE_RE.finditer(body):
+        stripped = match.group().strip()
 
         if stripped.startswith("# ") and title is None:
             title = stripped[2:].strip()
@@ -103,13 +203,18 @@ def parse_readme(readme_path: Path) -> Optional[Readme]:
             continue
 
         in_paragraph = True
+        summary_length += len(stripped) + (1 if summary_lines else 0)
         summary_lines.append(stripped)
+        # The summary is truncated anyway; once it is full and the title is
+        # known, the rest of a long paragraph can't change the result.
+        if title is not None and summary_length >= MAX_README_SUMMARY_LENGTH:
+            break
 
     summary = " ".join(summary_lines)[:MAX_README_SUMMARY_LENGTH] if summary_lines else None
     return Readme(frontmatter=frontmatter, title=title, summary=summary)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EchoSource:
     """A longecho-compliant data source."""
 
@@ -122,6 +227,9 @@ class EchoSource:
     site_path: Optional[Path] = None
     frontmatter: Optional[dict] = None
     contents: Optional[list[dict]] = None
+    # Raw README text as read during the compliance check, kept so build and
+    # search don't read the file a second time. None if it was unreadable.
+    readme_text: Optional[str] = field(default=None, repr=False, compare=False)
 
     def __str__(self) -> str:
         desc = self.description or "No description"
@@ -130,7 +238,7 @@ class EchoSource:
         return f"{self.path}: {desc}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ComplianceResult:
     """Result of a longecho compliance check."""
 
@@ -147,37 +255,88 @@ class ComplianceResult:
 
 def find_readme(path: Path) -> Optional[Path]:
     """Find README file at the root of a directory."""
-    for name in ["README.md", "README.txt", "readme.md", "readme.txt"]:
+    for name in README_NAMES:
         readme = path / name
         if readme.is_file():
             return readme
     return None
 
 
-def detect_durable_formats(path: Path, max_depth: int = DEFAULT_FORMAT_SCAN_DEPTH) -> list[str]:
-    """Detect durable file formats in a directory up to max_depth."""
-    found: set[str] = set()
+def _find_readme_in(path: Path, entries: list[os.DirEntry]) -> Optional[Path]:
+    """find_readme answered from an existing listing of ``path``."""
+    by_name = {e.name: e for e in entries}
+    for name in README_NAMES:
+        entry = by_name.get(name)
+        if entry is not None and entry.is_file():
+            return path / name
+    # On case-insensitive filesystems find_readme's stat also matches e.g.
+    # "Readme.md"; defer to it in that rare case so results don't differ.
+    if any(e.name.lower() in _README_NAMES_LOWER for e in entries):
+        return find_readme(path)
+    return None
+
 
-    def scan_directory(dir_path: Path, depth: int):
-        if depth > max_depth:
-            return
+def detect_durable_formats(
+    path: Path,
+    max_depth: int = DEFAULT_FORMAT_SCAN_DEPTH,
+    stop_at_first: bool = False,
+) -> list[str]:
+    """Detect durable file formats in a directory up to max_depth.
 
+    With ``stop_at_first``, returns as soon as one durable format is found,
+    for callers that only need to know whether any exist.
+    """
+    return _scan_formats(path, max_depth, stop_at_first)
+
+
+def _scan_formats(
+    path: Path,
+    max_depth: int,
+    stop_at_first: bool,
+    root_entries: Optional[list[os.DirEntry]] = None,
+) -> list[str]:
+    """Body of detect_durable_formats; reuses ``root_entries`` if the root is already listed."""
+    found: set[str] = set()
+    all_count = len(DURABLE_EXTENSIONS)
+    # Breadth-first walk over os.scandir: DirEntry answers is_file()/is_dir()
+    # from the directory listing, so most entries cost no extra stat(), and
+    # shallow files are seen before deep subtrees, which is where
+    # stop_at_first usually finds its answer.
+    queue: deque[tuple[str, int]] = deque([(os.fspath(path), 0)] if max_depth >= 0 else ())
+
+    while queue:
+        dir_path, depth = queue.popleft()
         try:
-            for item in dir_path.iterdir():
-                if item.name.startswith("."):
+            if depth == 0 and root_entries is not None:
+                entries = root_entries
+            else:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
                     continue
 
-                if item.is_file():
-                    if item.name not in EXCLUDE_PATTERNS:
-                        suffix = item.suffix.lower()
-                        if suffix in DURABLE_EXTENSIONS:
+                if entry.is_file():
+                    # Dotfiles are skipped above, so a plain rfind() gives
+                    # the same suffix as os.path.splitext() for less work.
+                    dot = name.rfind(".")
+                    if dot > 0 and name not in EXCLUDE_PATTERNS:
+                        suffix = name[dot:].lower()
+                        if suffix in DURABLE_EXTENSIONS and suffix not in found:
                             found.add(suffix)
-                elif item.is_dir():
-                    scan_directory(item, depth + 1)
-        except PermissionError:
+                            # Nothing left to discover once every durable
+                            # extension has turned up.
+                            if stop_at_first or len(found) == all_count:
+                                return sorted(found)
+                elif entry.is_dir() and depth < max_depth:
+                    queue.append((entry.path, depth + 1))
+        except OSError:
+            # Unreadable, vanished, or looping directories just contribute
+            # nothing (PermissionError is the common case).
             pass
 
-    scan_directory(path, 0)
     return sorted(found)
 
 
@@ -202,29 +361,61 @@ def _parse_contents(frontmatter: dict) -> Optional[list[dict]]:
     return entries if entries else None
 
 
-def check_compliance(path: Path) -> ComplianceResult:
-    """Check if a directory is longecho-compliant (has README + durable formats)."""
-    path = Path(path).resolve()
+def check_compliance(path: Path, all_formats: bool = True) -> ComplianceResult:
+    """Check if a directory is longecho-compliant (has README + durable formats).
+
+    Pass ``all_formats=False`` when only the verdict matters: the format
+    scan then stops at the first durable file, and the resulting source's
+    ``durable_formats`` lists just that one.
+    """
+    return _check_compliance_resolved(Path(path).resolve(), all_formats)
+
 
-    if not path.exists():
-        return ComplianceResult(compliant=False, path=path, reason="Path does not exist")
-    if not path.is_dir():
-        return ComplianceResult(compliant=False, path=path, reason="Path is not a directory")
+def _check_compliance_resolved(
+    path: Path,
+    all_formats: bool = True,
+    root_entries: Optional[list[os.DirEntry]] = None,
+) -> ComplianceResult:
+    """Body of check_compliance for a path that is already resolved.
 
-    readme_file = find_readme(path)
+    Discovery resolves its root once and builds children from directory
+    listings, so re-resolving every candidate would only repeat the same
+    per-component stat() calls. It also passes the listing it already has
+    as ``root_entries``.
+    """
+    if root_entries is None:
+        if not path.exists():
+            return ComplianceResult(compliant=False, path=path, reason="Path does not exist")
+        if not path.is_dir():
+            return ComplianceResult(compliant=False, path=path, reason="Path is not a directory")
+
+        # List the root once and answer both "is there a README" and the
+        # top level of the format scan from it.
+        try:
+            with os.scandir(path) as it:
+                root_entries = list(it)
+        except OSError:
+            root_entries = None
+
+    if root_entries is None:
+        readme_file = find_readme(path)
+    else:
+        readme_file = _find_readme_in(path, root_entries)
     if not readme_file:
         return ComplianceResult(
             compliant=False, path=path, reason="No README.md or README.txt found"
         )
 
-    durable = detect_durable_formats(path)
+    durable = _scan_formats(
+        path, DEFAULT_FORMAT_SCAN_DEPTH, not all_formats, root_entries
+    )
 
     if not durable:
         return ComplianceResult(
             compliant=False, path=path, reason="No durable data formats found"
         )
 
-    readme = parse_readme(readme_file)
+    readme_text, readme = _load_readme(readme_file)
 
     # Name cascade: frontmatter name > # Heading > dirname
     name = (readme.title if readme else None) or path.name
@@ -237,8 +428,10 @@ def check_compliance(path: Path) -> ComplianceResult:
         description = frontmatter.get("description", description)
         contents = _parse_contents(frontmatter)
 
+    # A single stat of site/index.html answers both "does site/ exist" and
+    # "does it have an entry point".
     site_dir = path / "site"
-    has_site = site_dir.exists() and (site_dir / "index.html").exists()
+    has_site = (site_dir / "index.html").is_file()
     site_path = site_dir if has_site else None
 
     source = EchoSource(
@@ -251,6 +444,7 @@ def check_compliance(path: Path) -> ComplianceResult:
         site_path=site_path,
         frontmatter=frontmatter,
         contents=contents,
+        readme_text=readme_text,
     )
 
     return ComplianceResult(compliant=True, path=path, source=source)
@@ -6,10 +6,8 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .build import build_site, make_json_safe
 from .checker import DURABLE_FORMAT_CATEGORIES, check_compliance
 from .discovery import discover_sources, search_sources
 
@@ -75,7 +73,9 @@ def check(
     ),
 ):
     """Check if a directory is longecho-compliant."""
-    result = check_compliance(path)
+    # The format list is only shown with --verbose; otherwise one durable
+    # file is enough to decide compliance.
+    result = check_compliance(path, all_formats=verbose)
 
     if result.compliant:
         console.print(f"[green]\u2713[/green] longecho-compliant: {path}")
@@ -133,12 +133,16 @@ def query(
     ),
 ):
     """Find, search, and filter sources across the archive tree."""
+    # Sources are consumed as discovery yields them, so large trees start
+    # printing right away instead of after the whole walk.
     if search:
-        sources = list(search_sources(path, search, depth))
+        sources = search_sources(path, search, depth)
     else:
-        sources = list(discover_sources(path, depth))
+        sources = discover_sources(path, depth)
 
     if json_format:
+        from .build import make_json_safe
+
         output: list[dict] = []
         for s in sources:
             try:
@@ -158,12 +162,10 @@ def query(
         print(json.dumps(output, indent=2, ensure_ascii=False))
         return
 
-    if not sources:
-        label = f"matching '{search}'" if search else f"under {path}"
-        console.print(f"[yellow]No longecho sources found {label}[/yellow]")
-        return
-
+    found = 0
     if table_format:
+        from rich.table import Table
+
         table = Table(title=f"longecho sources under {path}")
         table.add_column("Name", style="cyan")
         table.add_column("Path")
@@ -177,12 +179,11 @@ def query(
                 ", ".join(s.durable_formats[:3]),
                 _truncate(s.description or "", 50),
             )
+            found += 1
 
-        console.print(table)
+        if found:
+            console.print(table)
     else:
-        console.print(f"[bold]Found {len(sources)} source(s):[/bold]")
-        console.print()
-
         for s in sources:
             # Compute indentation and relative path from query root
             try:
@@ -194,10 +195,21 @@ def query(
                 display_path = str(s.path)
             indent = "  " * depth_level
 
-            console.print(f"{indent}[cyan]{s.name}[/cyan]  [dim]{display_path}[/dim]")
+            # One print per source keeps rich's layout and flush work to a
+            # single call while still streaming.
+            lines = [f"{indent}[cyan]{s.name}[/cyan]  [dim]{display_path}[/dim]"]
             if s.description:
-                console.print(f"{indent}  [dim]{_truncate(s.description, 80)}[/dim]")
-            console.print()
+                lines.append(f"{indent}  [dim]{_truncate(s.description, 80)}[/dim]")
+            lines.append("")
+            console.print("\n".join(lines))
+            found += 1
+
+        if found:
+            console.print(f"[bold]Found {found} source(s)[/bold]")
+
+    if not found:
+        label = f"matching '{search}'" if search else f"under {path}"
+        console.print(f"[yellow]No longecho sources found {label}[/yellow]")
 
 
 @app.command()
@@ -229,8 +241,9 @@ def build(
     ),
 ):
     """Build a single-file static site from a longecho archive."""
-    console.print(f"[bold]Building site for:[/bold] {path}")
+    from .build import build_site
 
+    console.print(f"[bold]Building site for:[/bold] {path}")
     result = build_site(path=path, output=output, force=force)
 
     if result.success:
@@ -1,20 +1,41 @@
 """longecho source discovery -- find and search longecho-compliant directories."""
 
+import os
+import stat
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
-from .checker import EchoSource, check_compliance
+from .checker import (
+    ComplianceResult,
+    EchoSource,
+    _check_compliance_resolved,
+    check_compliance,
+)
 
 # Directories to skip during discovery (dot-prefixed dirs are always skipped
 # via the startswith(".") check in should_skip_directory, so only non-dot
 # names need to be listed here).
-SKIP_DIRECTORIES: set[str] = {
+SKIP_DIRECTORIES: frozenset[str] = frozenset({
     "node_modules", "__pycache__",
     "venv", "env",
     "dist", "build",
     "site-packages",
-}
+})
+
+# A directory's compliance result plus the subdirectories to walk into
+# (None if the directory is unreadable).
+_Listing = tuple[ComplianceResult, Optional[list[Path]]]
+
+# Worker threads used to run compliance checks ahead of the discovery walk.
+DISCOVERY_WORKERS: int = 8
+
+# Directories listed and checked ahead of the walk. Finished results wait
+# until the walk reaches them, so this bounds memory regardless of how wide
+# the tree is.
+DISCOVERY_READAHEAD: int = 2 * DISCOVERY_WORKERS
 
 
 def should_skip_directory(name: str) -> bool:
@@ -30,39 +51,110 @@ def discover_sources(
     """Find all longecho-compliant directories under a root path."""
     root = Path(root).resolve()
 
-    if not root.exists() or not root.is_dir():
+    # One stat answers both "does it exist" and "is it a directory".
+    try:
+        if not stat.S_ISDIR(os.stat(root).st_mode):
+            return
+    except OSError:
+        return
+    if max_depth is not None and max_depth < 0:
         return
 
-    def scan_directory(path: Path, depth: int):
-        if max_depth is not None and depth > max_depth:
-            return
+    # Compliance checks (README read + format scan) are I/O bound, so the
+    # next few directories the walk will visit are listed and checked on a
+    # pool ahead of time. Results are still consumed in sorted depth-first
+    # order.
+    pool = ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS)
 
-        try:
-            result = check_compliance(path)
+    try:
+        # Explicit stack instead of recursion: deep trees can't hit the
+        # recursion limit. Children are pushed in reverse so they pop in
+        # sorted order, keeping the output depth-first and sorted.
+        stack: list[tuple[int, Path]] = [(0, root)]
+        prefetched: dict[Path, Future[_Listing]] = {}
+        # Resolved directories already queued. A followed symlink that points
+        # back at an ancestor (or at a directory reached some other way)
+        # resolves to a path in here and is skipped, so cycles terminate.
+        seen: set[Path] = {root}
+        while stack:
+            # The top of the stack is what the walk visits next.
+            for _, queued in reversed(stack):
+                if len(prefetched) >= DISCOVERY_READAHEAD:
+                    break
+                if queued not in prefetched:
+                    prefetched[queued] = pool.submit(
+                        _list_and_check, queued, follow_symlinks
+                    )
+
+            depth, path = stack.pop()
+            result, children = prefetched.pop(path).result()
             if result.compliant and result.source:
                 yield result.source
 
-            for item in sorted(path.iterdir()):
-                if not item.is_dir():
-                    continue
-                if not follow_symlinks and item.is_symlink():
-                    continue
-                if not should_skip_directory(item.name):
-                    yield from scan_directory(item, depth + 1)
-        except PermissionError:
-            pass
+            if children is None or (max_depth is not None and depth + 1 > max_depth):
+                continue
+
+            fresh = [child for child in children if child not in seen]
+            seen.update(fresh)
+            stack.extend((depth + 1, child) for child in reversed(fresh))
+    finally:
+        # Don't keep checking directories nobody will read if the caller
+        # stops iterating early.
+        pool.shutdown(cancel_futures=True)
+
+
+def _list_and_check(path: Path, follow_symlinks: bool) -> _Listing:
+    """List a directory once, check it, and return its subdirectories to walk.
 
-    yield from scan_directory(root, 0)
+    Subdirectories come back sorted by name; followed symlinks are resolved
+    so everything below them is canonical too. They are None when the
+    directory can't be read, in which case the walk does not descend into it.
+    Nothing else inside an unreadable directory is touched, since that would
+    only fail again.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return (
+            ComplianceResult(compliant=False, path=path, reason="Directory is not readable"),
+            None,
+        )
+    result = _check_compliance_resolved(path, root_entries=entries)
+
+    # Name filtering runs first, so skipped directories never cost a stat;
+    # DirEntry answers the rest from the listing. Only the kept
+    # subdirectories are sorted, on the name string rather than as Paths.
+    subdirs = sorted(
+        (
+            entry
+            for entry in entries
+            if not should_skip_directory(entry.name)
+            and entry.is_dir()
+            and (follow_symlinks or not entry.is_symlink())
+        ),
+        key=attrgetter("name"),
+    )
+    # Children of a resolved directory are already canonical unless they
+    # are symlinks.
+    children = [
+        Path(entry.path).resolve() if entry.is_symlink() else Path(entry.path)
+        for entry in subdirs
+    ]
+    return result, children
 
 
 def _build_search_text(source: EchoSource) -> str:
     """Build a searchable text blob from a source (name, description, README, frontmatter)."""
     parts = [source.name, source.description]
-    try:
-        content = source.readme_path.read_text(encoding="utf-8")
-        parts.append(content)
-    except (OSError, UnicodeDecodeError):
-        pass
+    if source.readme_text is not None:
+        parts.append(source.readme_text)
+    else:
+        try:
+            content = source.readme_path.read_text(encoding="utf-8")
+            parts.append(content)
+        except (OSError, UnicodeDecodeError):
+            pass
     if source.frontmatter:
         for v in source.frontmatter.values():
             parts.append(str(v))
@@ -71,10 +163,8 @@ def _build_search_text(source: EchoSource) -> str:
 
 def matches_query(source: EchoSource, query: str) -> bool:
     """Check if a source matches a text query. Case-insensitive substring match."""
-    if not query.strip():
-        return True
-    search_text = _build_search_text(source)
-    return query.strip().lower() in search_text
+    needle = query.strip().lower()
+    return not needle or needle in _build_search_text(source)
 
 
 def search_sources(
@@ -83,8 +173,11 @@ def search_sources(
     max_depth: Optional[int] = None
 ) -> Iterator[EchoSource]:
     """Search sources by text. Case-insensitive match against name, description, README, frontmatter."""
+    # Normalize the query once rather than per source; an empty query
+    # matches everything, so skip building search text entirely.
+    needle = query.strip().lower()
     for source in discover_sources(root, max_depth):
-        if matches_query(source, query):
+        if not needle or needle in _build_search_text(source):
             yield source
 
 
@@ -9,6 +9,7 @@ from longecho.build import (
     BuildResult,
     _get_data_files,
     _is_foreign_site,
+    _sanitize_html,
     build_site,
     discover_sub_sources,
     make_json_safe,
@@ -49,6 +50,21 @@ class TestMarkdownToHtml:
         result = markdown_to_html('<img src="x" onerror="alert(1)">')
         assert "onerror" not in result
 
+    def test_sanitizer_removes_spliced_void_tags(self):
+        assert _sanitize_html("<ba<me<link>ta>se href='x'>ok") == "ok"
+
+    def test_plain_text_fast_path_matches_markdown(self):
+        import markdown
+        for text in ["Just some words.", "two\nlines", "", "\n", "a < b & c"]:
+            expected = markdown.markdown(text, extensions=["fenced_code", "tables"])
+            assert markdown_to_html(text) == expected
+
+    def test_repeated_calls_do_not_share_state(self):
+        first = markdown_to_html("| a | b |\n|---|---|\n| 1 | 2 |")
+        assert "<table>" in first
+        assert markdown_to_html("plain text") == "<p>plain text</p>"
+        assert markdown_to_html("| a | b |\n|---|---|\n| 1 | 2 |") == first
+
 
 class TestDiscoverSubSources:
     """Tests for discover_sub_sources function."""
@@ -128,6 +144,26 @@ class TestDiscoverSubSources:
         assert sources[0].name == "beta"
         assert sources[1].name == "alpha"
 
+    def test_contents_cannot_escape_or_list_root(self, temp_dir):
+        """Contents entries outside the source (or the source itself) are ignored."""
+        root = temp_dir / "root"
+        root.mkdir()
+        (root / "README.md").write_text(
+            "---\ncontents:\n  - path: ../outside/\n  - path: .\n"
+            "  - path: link/\n  - path: inner/../inner/\n---\n# Root\n\nRoot."
+        )
+        (root / "index.json").write_text("[]")
+        for d in (temp_dir / "outside", root / "inner"):
+            d.mkdir()
+            (d / "README.md").write_text(f"# {d.name}\n\nSource.")
+            (d / "data.db").touch()
+        (root / "link").symlink_to("../outside")
+
+        result = check_compliance(root)
+        assert result.source is not None
+        sources = discover_sub_sources(result.source)
+        assert [s.name for s in sources] == ["inner"]
+
     def test_auto_discovery_alphabetical(self, temp_dir):
         """Without contents, sources are discovered alphabetically."""
         (temp_dir / "README.md").write_text("# Root\n\nRoot.")
@@ -182,6 +218,61 @@ class TestDiscoverSubSources:
 class TestBuildSite:
     """Tests for build_site function."""
 
+    def test_checks_each_sub_source_once(self, nested_echo_sources, monkeypatch):
+        import longecho.build as build_mod
+
+        (nested_echo_sources / "README.md").write_text("# Root\n\nRoot.")
+        (nested_echo_sources / "index.json").write_text("[]")
+
+        calls: list[Path] = []
+        real_check = build_mod.check_compliance
+
+        def counting_check(p):
+            calls.append(Path(p))
+            return real_check(p)
+
+        monkeypatch.setattr(build_mod, "check_compliance", counting_check)
+        result = build_site(nested_echo_sources)
+        assert result.success is True
+        assert len(calls) == len(set(calls))
+
+        # The cache only lives for the duration of a build
+        first_build = len(calls)
+        assert build_site(nested_echo_sources).success is True
+        assert len(calls) == 2 * first_build
+
+    def test_unusable_bytecode_cache_dir_does_not_fail_build(
+        self, echo_compliant_dir, monkeypatch
+    ):
+        import longecho.build as build_mod
+
+        def unsafe_dir(*args, **kwargs):
+            raise RuntimeError("Cannot determine safe temp directory.")
+
+        monkeypatch.setattr(build_mod, "FileSystemBytecodeCache", unsafe_dir)
+        monkeypatch.setattr(build_mod, "_jinja_env", None)
+        build_mod._get_template.cache_clear()
+        try:
+            result = build_site(echo_compliant_dir)
+            assert result.success is True
+            assert build_mod.get_jinja_env().bytecode_cache is None
+        finally:
+            build_mod._get_template.cache_clear()
+
+    def test_failed_render_keeps_existing_index(self, echo_compliant_dir):
+        site = echo_compliant_dir / "site"
+        site.mkdir()
+        (site / "index.html").write_text("old!")
+        # A YAML set survives make_json_safe and makes tojson fail mid-render.
+        (echo_compliant_dir / "README.md").write_text(
+            "---\nblob: !!set {a, b}\n---\n# Test Archive\n\nData.\n"
+        )
+
+        with pytest.raises(TypeError):
+            build_site(echo_compliant_dir)
+        assert (site / "index.html").read_text() == "old!"
+        assert sorted(p.name for p in site.iterdir()) == ["index.html"]
+
     def test_requires_compliance(self, temp_dir):
         result = build_site(temp_dir)
         assert result.success is False
@@ -445,6 +536,28 @@ class TestRecursiveBuild:
         # ChatGPT has no children
         assert len(root_data["children"][0]["children"][0]["children"]) == 0
 
+    def test_many_children_keep_alphabetical_order(self, temp_dir):
+        """Children converted in parallel still appear in discovery order."""
+        import re
+        (temp_dir / "README.md").write_text("# Root\n\nRoot.")
+        (temp_dir / "index.json").write_text("[]")
+        names = [f"src{i:02d}" for i in range(12)]
+        for n in reversed(names):
+            d = temp_dir / n
+            d.mkdir()
+            (d / "README.md").write_text(f"# {n}\n\nSource {n}.")
+            (d / "data.json").write_text("{}")
+
+        result = build_site(temp_dir)
+        assert result.success is True
+        assert result.sources_count == 12
+
+        index_content = (result.output_path / "index.html").read_text()
+        match = re.search(r'var ROOT = (.+?);\n', index_content)
+        assert match is not None
+        root_data = json.loads(match.group(1))
+        assert [c["name"] for c in root_data["children"]] == names
+
 
 class TestMakeJsonSafe:
     """Tests for make_json_safe function."""
@@ -523,6 +636,26 @@ class TestRecursiveDataFiles:
         # sub.jsonl belongs to the sub-source, not the parent
         assert not any("sub.jsonl" in n for n in names)
 
+    def test_stops_at_nested_sources_with_differently_cased_readme(
+        self, temp_dir, monkeypatch
+    ):
+        """On case-insensitive filesystems "Readme.md" also marks a nested source."""
+        import longecho.checker as checker_mod
+
+        def case_insensitive_find_readme(path):
+            names = {p.name.lower(): p for p in path.iterdir()}
+            return names.get("readme.md")
+
+        monkeypatch.setattr(checker_mod, "find_readme", case_insensitive_find_readme)
+        sub = temp_dir / "subsource"
+        sub.mkdir()
+        (sub / "Readme.md").write_text("# Sub\n\nA sub-source.")
+        (sub / "sub.jsonl").write_text("")
+
+        source = self._make_source(temp_dir)
+        names = [f["name"] for f in _get_data_files(source, temp_dir / "site")]
+        assert not any("sub.jsonl" in n for n in names)
+
     def test_skips_site_directory(self, temp_dir):
         """site/ subdirectory should never appear in data files (it's a viewer)."""
         (temp_dir / "data.json").write_text("{}")
@@ -549,6 +682,24 @@ class TestRecursiveDataFiles:
         assert "README.md" not in names
         assert "CLAUDE.md" not in names
 
+    def test_link_paths_relative_to_output(self, temp_dir):
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "data.json").write_text("{}")
+        source = self._make_source(temp_dir)
+
+        files = _get_data_files(source, temp_dir / "site")
+        assert files == [{"name": "sub/data.json", "path": "sub/data.json"}]
+
+    def test_link_paths_outside_archive_use_file_uri(self, temp_dir):
+        archive = temp_dir / "archive"
+        archive.mkdir()
+        (archive / "data.json").write_text("{}")
+        source = self._make_source(archive)
+
+        files = _get_data_files(source, temp_dir / "elsewhere" / "out" / "site")
+        assert files[0]["name"] == "data.json"
+        assert files[0]["path"] == (archive / "data.json").as_uri()
+
 
 class TestIsForeignSite:
     """Tests for _is_foreign_site detection."""
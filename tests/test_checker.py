@@ -106,6 +106,36 @@ class TestDetectDurableFormats:
         formats = detect_durable_formats(temp_dir, max_depth=1)
         assert ".txt" in formats
 
+    def test_stop_at_first(self, temp_dir):
+        (temp_dir / "data.json").write_text("{}")
+        (temp_dir / "notes.md").write_text("# Notes")
+        (temp_dir / "table.csv").write_text("a,b")
+
+        formats = detect_durable_formats(temp_dir, stop_at_first=True)
+        assert len(formats) == 1
+        assert formats[0] in {".json", ".md", ".csv"}
+
+    def test_stop_at_first_prefers_shallow_files(self, temp_dir):
+        (temp_dir / "a" / "deep").mkdir(parents=True)
+        (temp_dir / "a" / "deep" / "data.json").write_text("{}")
+        (temp_dir / "b").mkdir()
+        (temp_dir / "b" / "notes.md").write_text("# Notes")
+
+        assert detect_durable_formats(temp_dir, stop_at_first=True) == [".md"]
+
+    def test_stop_at_first_empty(self, temp_dir):
+        (temp_dir / "config.ini").write_text("[section]")
+        assert detect_durable_formats(temp_dir, stop_at_first=True) == []
+
+    def test_finds_every_durable_extension(self, temp_dir):
+        for i, ext in enumerate(sorted(DURABLE_EXTENSIONS)):
+            (temp_dir / f"file{i}{ext}").touch()
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "extra.json").write_text("{}")
+
+        formats = detect_durable_formats(temp_dir)
+        assert formats == sorted(DURABLE_EXTENSIONS)
+
 
 class TestIsDurableFormat:
     """Tests for is_durable_format function."""
@@ -153,6 +183,27 @@ class TestIsDurableFormat:
 class TestCheckCompliance:
     """Tests for check_compliance function."""
 
+    def test_readme_name_priority(self, temp_dir):
+        (temp_dir / "README.txt").write_text("Text readme.")
+        (temp_dir / "readme.md").write_text("# Lower\n\nLowercase readme.")
+        (temp_dir / "data.json").write_text("{}")
+
+        result = check_compliance(temp_dir)
+        assert result.source is not None
+        assert result.source.readme_path.name == "README.txt"
+
+        (temp_dir / "README.md").write_text("# Upper\n\nUppercase readme.")
+        result = check_compliance(temp_dir)
+        assert result.source.readme_path.name == "README.md"
+
+    def test_readme_directory_is_not_a_readme(self, temp_dir):
+        (temp_dir / "README.md").mkdir()
+        (temp_dir / "data.json").write_text("{}")
+
+        result = check_compliance(temp_dir)
+        assert result.compliant is False
+        assert "README" in result.reason
+
     def test_compliant_directory(self, echo_compliant_dir):
         result = check_compliance(echo_compliant_dir)
 
@@ -311,6 +362,12 @@ class TestEchoSource:
 class TestCheckComplianceEchoSource:
     """Tests for EchoSource population in check_compliance."""
 
+    def test_keeps_readme_text(self, echo_compliant_dir):
+        result = check_compliance(echo_compliant_dir)
+        assert result.source is not None
+        expected = (echo_compliant_dir / "README.md").read_text()
+        assert result.source.readme_text == expected
+
     def test_name_from_readme_title(self, echo_compliant_dir):
         result = check_compliance(echo_compliant_dir)
         assert result.source is not None
@@ -51,6 +51,13 @@ class TestQueryCommand:
         assert result.exit_code == 0
         assert "source" in result.stdout.lower()
 
+    def test_query_streams_sources_then_count(self, nested_echo_sources):
+        result = runner.invoke(app, ["query", str(nested_echo_sources)])
+
+        out = result.stdout
+        assert out.index("Bookmarks Archive") < out.index("Personal Blog")
+        assert out.rstrip().endswith("Found 3 source(s)")
+
     def test_query_search(self, nested_echo_sources):
         result = runner.invoke(app, [
             "query", str(nested_echo_sources),
@@ -1,5 +1,7 @@
 """Tests for longecho source discovery."""
 
+import errno
+import os
 from pathlib import Path
 
 from longecho.checker import EchoSource
@@ -63,6 +65,67 @@ class TestDiscoverSources:
         paths = [str(s.path) for s in sources]
         assert not any("other" in p for p in paths)
 
+    def test_depth_first_sorted_order(self, nested_echo_sources):
+        sources = list(discover_sources(nested_echo_sources))
+        rel = [s.path.relative_to(nested_echo_sources).as_posix() for s in sources]
+        assert rel == ["bookmarks", "ctk-export", "projects/blog"]
+
+    def test_max_depth_zero_checks_root_only(self, nested_echo_sources):
+        assert list(discover_sources(nested_echo_sources, max_depth=0)) == []
+        blog = nested_echo_sources / "projects" / "blog"
+        assert [s.name for s in discover_sources(blog, max_depth=0)] == ["Personal Blog"]
+
+    def test_stopping_early(self, nested_echo_sources):
+        it = discover_sources(nested_echo_sources)
+        first = next(it)
+        assert first.path.name == "bookmarks"
+        it.close()
+
+    def test_followed_symlink_reports_resolved_path(self, nested_echo_sources, tmp_path_factory):
+        root = tmp_path_factory.mktemp("links")
+        (root / "linked").symlink_to(nested_echo_sources / "projects")
+        assert list(discover_sources(root)) == []
+        sources = list(discover_sources(root, follow_symlinks=True))
+        assert [s.path for s in sources] == [(nested_echo_sources / "projects" / "blog").resolve()]
+
+    def test_unreadable_directory_is_skipped(self, nested_echo_sources, monkeypatch):
+        locked = nested_echo_sources / "locked"
+        locked.mkdir()
+
+        # Simulate mode 000 (root ignores permission bits): listing the
+        # directory or stat()ing anything inside it fails with EACCES.
+        def denied(p):
+            return PermissionError(errno.EACCES, "Permission denied", os.fspath(p))
+
+        real_scandir, real_stat = os.scandir, Path.stat
+
+        def scandir(p="."):
+            if Path(p) == locked:
+                raise denied(p)
+            return real_scandir(p)
+
+        def stat(self, *args, **kwargs):
+            if self.parent == locked:
+                raise denied(self)
+            return real_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        monkeypatch.setattr(Path, "stat", stat)
+
+        sources = list(discover_sources(nested_echo_sources))
+        rel = [s.path.relative_to(nested_echo_sources).as_posix() for s in sources]
+        assert rel == ["bookmarks", "ctk-export", "projects/blog"]
+
+    def test_followed_symlink_cycle_terminates(self, temp_dir):
+        a = temp_dir / "a"
+        a.mkdir()
+        (a / "README.md").write_text("# A\n\nSource A.\n")
+        (a / "data.json").write_text("{}")
+        (a / "up").symlink_to("..")
+
+        sources = list(discover_sources(temp_dir, follow_symlinks=True))
+        assert [s.path for s in sources] == [a.resolve()]
+
 
 class TestMatchesQuery:
     """Tests for matches_query -- plain text search."""
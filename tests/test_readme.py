@@ -2,7 +2,7 @@
 
 import datetime
 
-from longecho.checker import _split_frontmatter, parse_readme
+from longecho.checker import _split_frontmatter, check_compliance, parse_readme
 
 
 class TestSplitFrontmatter:
@@ -31,6 +31,17 @@ class TestSplitFrontmatter:
         assert fm is None  # malformed = no frontmatter
         assert content == body  # return original content as body
 
+    def test_flat_frontmatter_matches_yaml(self):
+        import yaml
+        yaml_text = "name: My Archive\ndescription: Notes, links (mostly) and it's fine"
+        fm, body = _split_frontmatter(f"---\n{yaml_text}\n---\nBody")
+        assert fm == yaml.safe_load(yaml_text)
+        assert body == "Body"
+
+    def test_yaml_special_words_not_treated_as_strings(self):
+        fm, _ = _split_frontmatter("---\npublic: yes\ndraft: Off\nowner: null\n---\n")
+        assert fm == {"public": True, "draft": False, "owner": None}
+
     def test_frontmatter_must_start_at_beginning(self):
         content = "Some text\n---\ntitle: Hello\n---\nMore text"
         fm, body = _split_frontmatter(content)
@@ -89,3 +100,51 @@ class TestParseReadme:
         readme.write_text("# Title\n\n" + "x" * 600)
         result = parse_readme(readme)
         assert len(result.summary) <= 500
+
+    def test_unchanged_readme_is_read_once(self, tmp_path, monkeypatch):
+        readme = tmp_path / "README.md"
+        readme.write_text("# Cached\n\nBody.")
+
+        opened: list[str] = []
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(file)
+            return open(file, *args, **kwargs)
+
+        monkeypatch.setattr("longecho.checker.open", counting_open, raising=False)
+        assert parse_readme(readme) == parse_readme(readme)
+        assert len(opened) == 1
+
+    def test_mutating_title_does_not_touch_cache(self, tmp_path):
+        (tmp_path / "README.md").write_text("# Cached\n\nBody.")
+        (tmp_path / "data.json").write_text("{}")
+
+        parse_readme(tmp_path / "README.md").title = "HACKED"
+        assert parse_readme(tmp_path / "README.md").title == "Cached"
+        assert check_compliance(tmp_path).source.name == "Cached"
+
+    def test_mutating_results_does_not_touch_cache(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text(
+            "---\nname: Kept\ntags: [a]\ncontents:\n  - path: sub/\n---\n# Cached\n"
+        )
+        (tmp_path / "data.json").write_text("{}")
+
+        parsed = parse_readme(readme)
+        parsed.frontmatter["name"] = "Changed"
+        parsed.frontmatter["tags"].append("b")
+        source = check_compliance(tmp_path).source
+        source.frontmatter.clear()
+        source.contents[0]["path"] = "elsewhere/"
+
+        again = parse_readme(readme)
+        assert again.frontmatter["name"] == "Kept"
+        assert again.frontmatter["tags"] == ["a"]
+        assert check_compliance(tmp_path).source.contents == [{"path": "sub/"}]
+
+    def test_rewritten_readme_is_reparsed(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text("# First\n\nBody.")
+        assert parse_readme(readme).title == "First"
+        readme.write_text("# Second title\n\nBody.")
+        assert parse_readme(readme).title == "Second title"